@@ -113,6 +113,7 @@ class ExportWorker(QThread):
     
     def run(self):
         """Execute the export operation"""
+        exporter = None
         try:
             self.progress.emit("Loading XDF definition...")
             exporter = UniversalXDFExporter(self.xdf_path, self.bin_path)
@@ -120,14 +121,8 @@ class ExportWorker(QThread):
             if self.skip_validation:
                 self.progress.emit("Skipping validation (forced mode)...")
                 # Still need to read the binary file, just don't validate size
-                try:
-                    with open(self.bin_path, 'rb') as f:
-                        exporter.bin_data = f.read()
-                        exporter.bin_size = len(exporter.bin_data)
-                    import hashlib
-                    exporter.bin_md5 = hashlib.md5(exporter.bin_data).hexdigest()
-                except Exception as e:
-                    self.finished.emit(False, f"Could not read binary file!\n\nError: {e}", [])
+                if not exporter.load_bin_file():
+                    self.finished.emit(False, f"Could not read binary file!\n\nError: {exporter.bin_load_error}", [])
                     return
             else:
                 self.progress.emit("Validating binary file...")
@@ -176,6 +171,9 @@ class ExportWorker(QThread):
         
         except Exception as e:
             self.finished.emit(False, f"Export failed!\n\nError: {str(e)}", [])
+        finally:
+            if exporter is not None:
+                exporter.close()
     
     def _export_csv(self, exporter, output_file: str):
         """Export to CSV format for spreadsheet analysis"""
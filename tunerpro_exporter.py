@@ -70,19 +70,31 @@
 """
 
 import xml.etree.ElementTree as ET
-import struct
+import ast
 import hashlib
 import logging
 import math
+import mmap
+import struct
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Callable
 import re
 import sys
 import statistics
 import json
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 import io
 
+try:
+    # Optional: lxml parses large XDFs faster and drops blank text nodes
+    from lxml import etree as LET
+    XML_PARSE_ERRORS = (ET.ParseError, LET.XMLSyntaxError)
+except ImportError:
+    LET = None
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
 # Fix Windows console encoding for UTF-8 characters
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -96,6 +108,361 @@ __author_alias__ = "kingaustraliagg"  # PCMHacking forum username
 __email__ = "jason.king@kingai.com.au"
 __copyright__ = "Copyright (c) 2025 KingAI Pty Ltd"
 
+# Chunk size for streaming the BIN through the checksum
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Characters of encoded JSON gathered before each write to the output file
+JSON_WRITE_CHUNK = 64 * 1024  # 64 KiB
+
+# struct type codes for XDF element data, keyed by (size_bits, signed)
+STRUCT_TYPECODES = {
+    (8, False): 'B', (8, True): 'b',
+    (16, False): 'H', (16, True): 'h',
+    (32, False): 'I', (32, True): 'i',
+}
+
+# Tags searched (in priority order) for titles, header names and addresses
+TITLE_TAGS = ('title', 'name', 'label', 'desc')
+HEADER_NAME_TAGS = ('deftitle', 'title', 'name')
+
+# EMBEDDEDDATA integer attributes and the _parse_embedded_data key they fill
+EMBEDDED_INT_ATTRS = (
+    ('mmedaddress', 'address'),
+    ('mmedelementsizebits', 'size_bits'),
+    ('mmedrowcount', 'row_count'),
+    ('mmedcolcount', 'col_count'),
+    ('mmedmajorstridebits', 'major_stride'),
+    ('mmedminorstridebits', 'minor_stride'),
+)
+ADDRESS_TAGS = ('mem', 'memory', 'addr')
+
+# Flag status labels, indexed by is_set (False, True)
+FLAG_STATUS_TEXT = ("Not Set", "Set")
+FLAG_STATUS_MD = ("❌ Not Set", "✅ Set")
+
+
+def _parse_int(text: Optional[str], default: Optional[int] = None) -> Optional[int]:
+    """
+    Parse an XDF integer attribute/text value (hex with 0x prefix, or decimal)
+    
+    Args:
+        text: Raw string from the XDF (may be None or empty)
+        default: Value returned when text is missing or malformed
+        
+    Returns:
+        int: Parsed value, or default
+    """
+    if not text:
+        return default
+    try:
+        return int(text, 16) if text[:2] == '0x' else int(text)
+    except ValueError:
+        return default
+
+
+def _hex_bytes(text: str) -> Optional[bytes]:
+    """
+    Decode an XDFPATCHENTRY hex string (e.g. "A5FF") to bytes
+    
+    Either case is accepted. Returns None unless text is plain,
+    even-length hex, so strings with spaces or stray characters never
+    match BIN contents.
+    """
+    try:
+        data = bytes.fromhex(text)
+    except ValueError:
+        return None
+    return data if data and len(text) == 2 * len(data) else None
+
+
+def _mean(values: List[float]) -> float:
+    """
+    Correctly rounded arithmetic mean (same result as statistics.mean)
+    
+    math.fsum returns the correctly rounded sum; feeding its negation
+    back in yields the exact residual, so a few C-speed passes express
+    the exact sum as a short list of floats. One exact division of that
+    sum then rounds once, without statistics.mean's per-value Fractions.
+    
+    Args:
+        values: Non-empty list of floats
+        
+    Returns:
+        float: Mean of values
+    """
+    try:
+        terms = []
+        partial = math.fsum(values)
+        while partial and math.isfinite(partial):
+            terms.append(partial)
+            partial = math.fsum(values + [-t for t in terms])
+    except OverflowError:
+        partial = math.inf
+    if not math.isfinite(partial):
+        return statistics.mean(values)  # inf/nan/overflow: let it decide
+    
+    ratios = [t.as_integer_ratio() for t in terms]
+    den = max((d for _, d in ratios), default=1)
+    return sum(n * (den // d) for n, d in ratios) / (den * len(values))
+
+
+# Format specs for the usual XDF decimal places (0-6), indexed by decimalpl
+FIXED_POINT_SPECS = tuple(f".{places}f" for places in range(7))
+
+
+@lru_cache(maxsize=8192)
+def _format_fixed(value: float, decimalpl: int) -> str:
+    """
+    Format a number with decimalpl places, cached per (value, decimalpl)
+    
+    Axis labels repeat across rows, tables and export formats, so most
+    calls are cache hits. Callers format zero through __wrapped__: 0.0 and
+    -0.0 are equal as cache keys but format differently ("0.00", "-0.00").
+    """
+    if decimalpl <= 0:
+        return str(int(round(value)))
+    if decimalpl < len(FIXED_POINT_SPECS):
+        return format(value, FIXED_POINT_SPECS[decimalpl])
+    return f"{value:.{decimalpl}f}"
+
+
+# Names available to XDF equations besides the per-cell variables.
+# 'E' is Euler's number here, not the row index (matches TunerPro).
+EQUATION_GLOBALS = {
+    'exp': math.exp,
+    'log': math.log,
+    'log10': math.log10,
+    'sqrt': math.sqrt,
+    'pow': math.pow,
+    'abs': abs,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'E': math.e,
+    'PI': math.pi,
+    'pi': math.pi,
+    '__builtins__': {}
+}
+
+# Lowercase/alternative variable names and the argument they alias
+EQUATION_ALIASES = {'x': 'X', 'a': 'A', 'b': 'B', 'e': 'A', 'y': 'Y', 'z': 'Z'}
+
+
+def _compile_equation(equation: str) -> Callable:
+    """
+    Compile a normalized XDF equation into f(X, A, B, Y, Z)
+    
+    X is the raw value, A/B the row/column index and Y/Z the y/x axis
+    values. Only aliases the expression actually references are bound.
+    Compile errors are deferred so they surface when the equation is
+    evaluated, exactly as eval() would report them.
+    
+    Args:
+        equation: Equation with entities stripped and leading operator fixed
+        
+    Returns:
+        Callable: Function returning the raw (unconverted) result
+    """
+    try:
+        names = compile(equation, '<string>', 'eval').co_names
+    except (SyntaxError, ValueError) as e:  # ValueError: e.g. NUL characters
+        error_type, error_args = type(e), e.args
+        
+        def _invalid(X, A=0, B=0, Y=0, Z=0):
+            raise error_type(*error_args)
+        return _invalid
+    
+    lines = ['def _equation(X, A=0, B=0, Y=0, Z=0):']
+    lines.extend(f'    {alias} = {name}' for alias, name in EQUATION_ALIASES.items() if alias in names)
+    # Expression on its own lines so a trailing "# comment" cannot swallow
+    # the closing parenthesis
+    lines.extend(['    return (', equation, '    )'])
+    scope = {}
+    try:
+        exec('\n'.join(lines), EQUATION_GLOBALS, scope)
+    except (SyntaxError, ValueError) as e:
+        error_type, error_args = type(e), e.args
+        
+        def _invalid(X, A=0, B=0, Y=0, Z=0):
+            raise error_type(*error_args)
+        return _invalid
+    return scope['_equation']
+
+
+# Equation normalization patterns (compiled once)
+_ENTITY_RE = re.compile(r'&#\d+;')  # XML character references (&#013;&#010;)
+_DIV_BY_X_RE = re.compile(r'/\s*[xX]\b')
+_NAMED_X_RE = re.compile(r'\bX\d+\b', re.IGNORECASE)  # X10, X1000, ...
+
+
+def _normalize_equation(equation: str) -> Tuple[str, Optional[str]]:
+    """
+    Normalize an XDF equation the way evaluate_math interprets it
+    
+    Args:
+        equation: Raw XDF equation string
+        
+    Returns:
+        Tuple: (cleaned equation for messages, expression to evaluate or
+                None when the value passes through unchanged)
+    """
+    # BUG FIX #2: Strip XML entities (&#013;&#010; = CRLF, etc)
+    equation = _ENTITY_RE.sub('', equation).strip()
+    
+    # BUG FIX #4: Handle null/empty equations
+    if not equation or equation.lower() in ('(null)', 'null', ''):
+        return equation, None
+    
+    # Handle simple X passthrough
+    if equation.upper() == 'X':
+        return equation, None
+    
+    # Fix equations starting with operator (e.g., "*2**14" -> "X*2**14")
+    equation_fixed = equation
+    if equation_fixed.startswith(('*', '/', '+', '-')):
+        equation_fixed = 'X' + equation_fixed
+    
+    # Named variables like X1000, X100, X10 all refer to the raw value
+    return equation, _NAMED_X_RE.sub('X', equation_fixed)
+
+
+# Binary operators allowed in affine equations, as (X op c, c op X) steps;
+# c / X is not affine
+_AFFINE_OPS = {
+    ast.Add: ('add', 'add'),
+    ast.Sub: ('sub', 'rsub'),
+    ast.Mult: ('mul', 'mul'),
+    ast.Div: ('div', None),
+}
+
+
+def _literal(node) -> Optional[float]:
+    """Value of an int/float literal node (optionally signed), else None"""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _literal(node.operand)
+        if value is not None:
+            return -value if isinstance(node.op, ast.USub) else +value
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _try_affine(equation: str) -> Optional[Tuple[Tuple[str, Optional[float]], ...]]:
+    """
+    Decompose an equation that only adds, subtracts, multiplies or
+    divides X by literals (e.g. "X*0.1", "(X-128)*0.75", "0.5*X+3",
+    "40-X") into ordered steps, so it can be applied without eval
+    
+    The steps keep the expression's own operation order and literal
+    types (int stays int), so applying them gives bit-identical values to
+    evaluating the expression.
+    
+    Args:
+        equation: Raw XDF equation string
+        
+    Returns:
+        Tuple of (op, literal) steps - empty for a passthrough - or None
+        if the equation is not of that form
+    """
+    _, expression = _normalize_equation(equation)
+    if expression is None:
+        return ()
+    try:
+        node = ast.parse(expression, mode='eval').body
+    except (SyntaxError, ValueError):
+        return None
+    
+    # Walk from the outermost operation down to X, then reverse
+    steps = []
+    while not (isinstance(node, ast.Name) and node.id in ('X', 'x')):
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            if isinstance(node.op, ast.USub):
+                steps.append(('neg', None))
+            node = node.operand
+            continue
+        if not isinstance(node, ast.BinOp) or type(node.op) not in _AFFINE_OPS:
+            return None
+        x_op_c, c_op_x = _AFFINE_OPS[type(node.op)]
+        right, left = _literal(node.right), _literal(node.left)
+        if right is not None:
+            if x_op_c == 'div' and right == 0:
+                return None  # Let evaluate_math report the division by zero
+            steps.append((x_op_c, right))
+            node = node.left
+        elif left is not None and c_op_x is not None:
+            steps.append((c_op_x, left))
+            node = node.right
+        else:
+            return None
+    
+    return tuple(reversed(steps))
+
+
+def _apply_affine(values: List[float], steps: Tuple[Tuple[str, Optional[float]], ...]) -> List[float]:
+    """Apply the steps found by _try_affine to a list of raw values"""
+    for op, c in steps:
+        if op == 'add':
+            values = [v + c for v in values]
+        elif op == 'sub':
+            values = [v - c for v in values]
+        elif op == 'rsub':
+            values = [c - v for v in values]
+        elif op == 'mul':
+            values = [v * c for v in values]
+        elif op == 'div':
+            values = [v / c for v in values]
+        else:  # 'neg'
+            values = [-v for v in values]
+    return list(values)
+
+
+@lru_cache(maxsize=4096)
+def _make_equation_callable(equation: str) -> Tuple[Optional[Callable], str, bool]:
+    """
+    Normalize and compile an XDF equation once per process for evaluate_math
+    
+    Tables and scalars reuse a handful of equation strings, so the cache
+    is shared by every exporter instance rather than kept per object.
+    
+    Args:
+        equation: Raw XDF equation string
+        
+    Returns:
+        Tuple: (compiled function or None for passthrough,
+                cleaned equation for messages, divides-by-X flag)
+    """
+    equation, equation_fixed = _normalize_equation(equation)
+    if equation_fixed is None:
+        return None, equation, False
+    
+    # BUG FIX #1: flag equations that divide by X for the zero pre-check
+    divides_by_x = _DIV_BY_X_RE.search(equation) is not None
+    
+    # BUG FIX #3: Math functions/constants come from EQUATION_GLOBALS
+    return _compile_equation(equation_fixed), equation, divides_by_x
+
+
+class _Writer:
+    """
+    Line buffer for text exports
+    
+    write() only appends to a list; flush() joins the pending text and
+    hands it to the file in one call (one encode, one buffered write).
+    """
+    
+    __slots__ = ('_out', '_parts', 'write')
+    
+    def __init__(self, out):
+        self._out = out
+        self._parts = []
+        self.write = self._parts.append
+    
+    def flush(self):
+        if self._parts:
+            self._out.write(''.join(self._parts))
+            self._parts.clear()
+
 
 class UniversalXDFExporter:
     """Universal XDF parser and exporter with TunerPro-style output"""
@@ -105,6 +472,10 @@ class UniversalXDFExporter:
     AUTHOR_GITHUB = __author_github__
     AUTHOR_ALIAS = __author_alias__
     
+    # Compiled struct layouts shared by all instances, keyed by format
+    # string ('>H', '<h', '>64H', ...)
+    _STRUCTS: Dict[str, struct.Struct] = {}
+    
     def __init__(self, xdf_path: str, bin_path: str):
         """
         Initialize exporter with XDF definition and BIN file
@@ -124,14 +495,16 @@ class UniversalXDFExporter:
         self.logger = logging.getLogger(__name__)
         
         # Storage for parsed data
-        self.xdf_root = None
         self.bin_data = None
+        self._bin_mmap = None
         self.bin_size = 0
         self.bin_md5 = ""
+        self.bin_load_error = ""  # Reason the last load_bin_file() failed
         
         # XDF metadata
         self.definition_name = "Unknown"
         self.categories = {}
+        self._cat_by_str = {}  # CATEGORYMEM text -> name (reset on new categories)
         self.elements = {
             'constants': [],
             'flags': [],
@@ -144,10 +517,15 @@ class UniversalXDFExporter:
         # When subtract=1: file_address = xdf_address - base_offset (same, XDF addresses are memory addresses)
         self.base_offset = 0
         self.base_subtract = 0  # 0 or 1
+        self._select_addr_translation()
         
         # Validation statistics
         self.validation_warnings = []
         self.suspicious_tables = []
+        
+        # id(table) -> [table, decoded data, validation or None], shared by
+        # the export formats
+        self._table_data_cache: Dict[int, List[Any]] = {}
     
     def _format_value(self, value: float, decimalpl: int = 2) -> str:
         """
@@ -160,10 +538,42 @@ class UniversalXDFExporter:
         Returns:
             str: Formatted value string
         """
-        if decimalpl <= 0:
-            return str(int(round(value)))
-        return f"{value:.{decimalpl}f}"
+        if not value:
+            # Keep the sign of -0.0 (see _format_fixed)
+            return _format_fixed.__wrapped__(value, decimalpl)
+        return _format_fixed(value, decimalpl)
+        
+    def load_bin_file(self) -> bool:
+        """
+        Map the binary file and compute its MD5, without size validation
+        
+        Returns:
+            bool: True if the file could be read, False otherwise (the
+                  error is kept in self.bin_load_error)
+        """
+        self.bin_load_error = ""
+        
+        # Map binary data (read-only, pages faulted in on demand)
+        try:
+            if self.bin_path.stat().st_size == 0:
+                # mmap cannot map an empty file
+                self.bin_data = memoryview(b'')
+            else:
+                with open(self.bin_path, 'rb') as f:
+                    self._bin_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # memoryview slices share the mapping instead of copying,
+                # so every table/scalar/patch read is allocation-free
+                self.bin_data = memoryview(self._bin_mmap)
+            self.bin_size = len(self.bin_data)
+        except Exception as e:
+            self.bin_load_error = str(e)
+            self.logger.error(f"Failed to read binary: {e}")
+            return False
+        self._table_data_cache.clear()  # Decoded from the previous BIN
         
+        self.bin_md5 = self._hash_bin()
+        return True
+    
     def validate_bin_file(self) -> bool:
         """
         Validate binary file integrity
@@ -175,18 +585,9 @@ class UniversalXDFExporter:
             self.logger.error(f"Binary file not found: {self.bin_path}")
             return False
         
-        # Read binary data
-        try:
-            with open(self.bin_path, 'rb') as f:
-                self.bin_data = f.read()
-                self.bin_size = len(self.bin_data)
-        except Exception as e:
-            self.logger.error(f"Failed to read binary: {e}")
+        if not self.load_bin_file():
             return False
         
-        # Calculate MD5
-        self.bin_md5 = hashlib.md5(self.bin_data).hexdigest()
-        
         # Validate size
         common_sizes = [
             128 * 1024,  # 128KB
@@ -207,6 +608,25 @@ class UniversalXDFExporter:
         )
         return True
     
+    def _hash_bin(self) -> str:
+        """
+        MD5 of the loaded BIN, used only to identify the file in exports
+        
+        Hashed over zero-copy 1 MiB slices; marked non-security so FIPS
+        builds allow it and OpenSSL can pick its fastest implementation.
+        
+        Returns:
+            str: Hex digest
+        """
+        try:
+            md5 = hashlib.md5(usedforsecurity=False)
+        except TypeError:  # Python 3.8
+            md5 = hashlib.md5()
+        view = memoryview(self.bin_data)
+        for start in range(0, len(view), HASH_CHUNK_SIZE):
+            md5.update(view[start:start + HASH_CHUNK_SIZE])
+        return md5.hexdigest()
+    
     def parse_xdf(self) -> bool:
         """
         Parse XDF file and extract all elements
@@ -218,25 +638,24 @@ class UniversalXDFExporter:
             self.logger.error(f"XDF file not found: {self.xdf_path}")
             return False
         
+        # Single streaming pass: each element is handled as soon as it is
+        # complete, then freed (no full DOM, no per-type tree walks)
+        handlers = {
+            'XDFHEADER': self._handle_header,
+            'CATEGORY': self._handle_category,
+            'XDFCONSTANT': self._handle_constant,
+            'XDFFLAG': self._handle_flag,
+            'XDFTABLE': self._handle_table,
+            'XDFPATCH': self._handle_patch,  # XDFPATCH support for Community Patchlist
+        }
+        
         try:
-            tree = ET.parse(self.xdf_path)
-            self.xdf_root = tree.getroot()
-        except ET.ParseError as e:
+            for elem in self._iter_stream(handlers):
+                handlers[elem.tag](elem)
+        except XML_PARSE_ERRORS as e:
             self.logger.error(f"Failed to parse XDF: {e}")
             return False
         
-        # Extract header information
-        self._extract_header()
-        
-        # Extract categories
-        self._extract_categories()
-        
-        # Extract all elements (universal approach)
-        self._extract_constants()
-        self._extract_flags()
-        self._extract_tables()
-        self._extract_patches()  # XDFPATCH support for Community Patchlist
-        
         self.logger.info(
             f"Parsed XDF: {len(self.elements['constants'])} constants, "
             f"{len(self.elements['flags'])} flags, "
@@ -244,62 +663,161 @@ class UniversalXDFExporter:
             f"{len(self.elements['patches'])} patches"
         )
         
+        if self.bin_data is not None:
+            self._validate_addresses()
+        
         return True
     
-    def _extract_header(self):
-        """Extract definition name and BASEOFFSET from XDF header"""
-        header = self.xdf_root.find('.//XDFHEADER')
-        if header is not None:
-            # Try multiple possible tags for definition name
-            for tag in ['deftitle', 'title', 'name']:
-                elem = header.find(tag)
-                if elem is not None and elem.text:
-                    self.definition_name = elem.text.strip()
-                    break
+    def _validate_addresses(self) -> int:
+        """
+        Range-check every constant and flag address against the BIN at once
+        
+        Checks each element's address and size without reading the BIN,
+        applying the same BASEOFFSET translation (including the raw-address
+        fallback for negative offsets). Out-of-range elements are recorded
+        in self.validation_warnings.
+        
+        Returns:
+            int: Number of elements whose data lies outside the BIN
+        """
+        shift = self._addr_shift
+        bin_size = self.bin_size
+        
+        checks = (
+            ('Constant', [(const, const['size'] // 8) for const in self.elements['constants']]),
+            ('Flag', [(flag, 1) for flag in self.elements['flags']]),
+        )
+        
+        bad_count = 0
+        for kind, items in checks:
+            for item, size_bytes in items:
+                address = item['address']
+                file_offset = address + shift
+                if file_offset < 0:
+                    file_offset = address
+                if 0 <= file_offset < bin_size and file_offset + size_bytes <= bin_size:
+                    continue
+                bad_count += 1
+                self.validation_warnings.append(
+                    f"{kind} '{item['title']}' at 0x{address:X} "
+                    f"(file offset 0x{file_offset:X}) is outside the "
+                    f"{bin_size}-byte BIN"
+                )
+        
+        if bad_count:
+            self.logger.warning(
+                f"{bad_count} constant/flag addresses fall outside the BIN "
+                f"- check the XDF matches this binary"
+            )
+        return bad_count
+    
+    def _iter_stream(self, handlers: Dict):
+        """
+        Stream XDF elements with iterparse (lxml when installed, else stdlib)
+        
+        Yields each element whose tag has a handler once it is fully parsed,
+        then clears it and drops its finished preceding siblings so peak
+        memory is bounded by the largest single element instead of the
+        whole file. Nothing is dropped while an enclosing handled element
+        (e.g. a CATEGORY inside XDFHEADER) is still being parsed.
+        
+        With lxml, whitespace-only text nodes are dropped at parse time,
+        ID indexing is disabled (XDF never uses it) and entity resolution
+        is off so a definition file cannot pull in external content.
+        
+        Args:
+            handlers: Dict mapping element tag -> handler method
             
-            # Extract BASEOFFSET - critical for 512KB and full-dump bin files
-            # Format 1: <BASEOFFSET offset="294912" subtract="0" />
-            baseoffset = header.find('.//BASEOFFSET')
-            if baseoffset is not None:
-                offset_str = baseoffset.get('offset', '0')
-                try:
-                    self.base_offset = int(offset_str, 16) if offset_str.startswith('0x') else int(offset_str)
-                except ValueError:
-                    self.base_offset = 0
+        Yields:
+            Completed XML elements with a registered handler
+        """
+        if LET is not None:
+            context = LET.iterparse(
+                str(self.xdf_path),
+                events=('start', 'end'),
+                huge_tree=True,
+                remove_blank_text=True,
+                collect_ids=False,
+                resolve_entities=False
+            )
+        else:
+            context = ET.iterparse(self.xdf_path, events=('start', 'end'))
+        _, root = next(context)
+        open_elems = [root]  # Parent chain (the stdlib has no getparent())
+        open_handled = 0  # Enclosing elements whose handler has not run yet
+        for event, elem in context:
+            if event == 'start':
+                open_elems.append(elem)
+                if elem.tag in handlers:
+                    open_handled += 1
+                continue
+            
+            open_elems.pop()
+            if elem.tag not in handlers:
+                continue
+            open_handled -= 1
+            yield elem
+            elem.clear()
+            
+            # Inside e.g. an open XDFHEADER, its earlier children are still
+            # needed by that element's handler
+            if open_handled:
+                continue
+            
+            # Drop finished preceding siblings (and, for the stdlib, the
+            # element itself); open ancestors are left intact
+            if LET is not None:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            else:
+                del open_elems[-1][:]
+    
+    def _handle_header(self, header):
+        """Extract definition name and BASEOFFSET from XDF header"""
+        # One walk over the header: first direct child of each name tag,
+        # first descendant of each BASEOFFSET spelling
+        found = {}
+        for child in header:
+            if child.tag in HEADER_NAME_TAGS:
+                found.setdefault(child.tag, child)
+            for elem in child.iter():
+                if elem.tag in ('BASEOFFSET', 'baseoffset'):
+                    found.setdefault(elem.tag, elem)
+        
+        # Try multiple possible tags for definition name
+        for tag in HEADER_NAME_TAGS:
+            elem = found.get(tag)
+            if elem is not None and elem.text:
+                self.definition_name = elem.text.strip()
+                break
+        
+        # Extract BASEOFFSET - critical for 512KB and full-dump bin files
+        # Format 1: <BASEOFFSET offset="294912" subtract="0" />
+        baseoffset = found.get('BASEOFFSET')
+        if baseoffset is not None:
+            self.base_offset = _parse_int(baseoffset.get('offset'), 0)
+            self.base_subtract = _parse_int(baseoffset.get('subtract'), 0)
                 
-                subtract_str = baseoffset.get('subtract', '0')
-                try:
-                    self.base_subtract = int(subtract_str)
-                except ValueError:
-                    self.base_subtract = 0
-                    
+            if self.base_offset != 0:
+                self.logger.info(f"BASEOFFSET detected: offset={self.base_offset} (0x{self.base_offset:X}), subtract={self.base_subtract}")
+        
+        # Format 2: <baseoffset>0</baseoffset> (lowercase simple format)
+        if self.base_offset == 0:
+            baseoffset_simple = found.get('baseoffset')
+            if baseoffset_simple is not None and baseoffset_simple.text:
+                self.base_offset = _parse_int(baseoffset_simple.text.strip(), 0)
                 if self.base_offset != 0:
-                    self.logger.info(f"BASEOFFSET detected: offset={self.base_offset} (0x{self.base_offset:X}), subtract={self.base_subtract}")
-            
-            # Format 2: <baseoffset>0</baseoffset> (lowercase simple format)
-            if self.base_offset == 0:
-                baseoffset_simple = header.find('.//baseoffset')
-                if baseoffset_simple is not None and baseoffset_simple.text:
-                    try:
-                        offset_text = baseoffset_simple.text.strip()
-                        self.base_offset = int(offset_text, 16) if offset_text.startswith('0x') else int(offset_text)
-                        if self.base_offset != 0:
-                            self.logger.info(f"BASEOFFSET (simple format) detected: offset={self.base_offset} (0x{self.base_offset:X})")
-                    except ValueError:
-                        pass
-    
-    def _extract_categories(self):
-        """Extract category definitions"""
-        for cat in self.xdf_root.findall('.//CATEGORY'):
-            index = cat.get('index')
-            name = cat.get('name', 'Unknown')
-            if index:
-                # Handle hex or decimal index
-                if index.startswith('0x'):
-                    idx = int(index, 16)
-                else:
-                    idx = int(index)
-                self.categories[idx] = name
+                    self.logger.info(f"BASEOFFSET (simple format) detected: offset={self.base_offset} (0x{self.base_offset:X})")
+        
+        self._select_addr_translation()
+    
+    def _handle_category(self, cat):
+        """Extract a category definition"""
+        # Handle hex or decimal index
+        idx = _parse_int(cat.get('index'))
+        if idx is not None:
+            self.categories[idx] = cat.get('name', 'Unknown')
+            self._cat_by_str.clear()
     
     def _get_address(self, element) -> Optional[int]:
         """
@@ -317,42 +835,29 @@ class UniversalXDFExporter:
         Returns:
             int: Address or None if not found
         """
-        # Method 1: EMBEDDEDDATA with mmedaddress
-        embedded = element.find('.//EMBEDDEDDATA')
+        # Method 1: EMBEDDEDDATA with mmedaddress (with or without mmedtypeflags)
+        embedded = element.find('EMBEDDEDDATA')
         if embedded is not None:
-            addr = embedded.get('mmedaddress')
-            if addr:
-                try:
-                    return int(addr, 16) if addr.startswith('0x') else int(addr)
-                except ValueError:
-                    pass
-            
-            # Check for mmedtypeflags format
-            if embedded.get('mmedtypeflags'):
-                addr = embedded.get('mmedaddress')
-                if addr:
-                    try:
-                        return int(addr, 16) if addr.startswith('0x') else int(addr)
-                    except ValueError:
-                        pass
+            addr = _parse_int(embedded.get('mmedaddress'))
+            if addr is not None:
+                return addr
         
         # Method 2: Direct address attribute
-        addr = element.get('address')
-        if addr:
-            try:
-                return int(addr, 16) if addr.startswith('0x') else int(addr)
-            except ValueError:
-                pass
-        
-        # Method 3: mem/memory child element
-        for tag in ['mem', 'memory', 'addr']:
-            mem = element.find(f'.//{tag}')
+        addr = _parse_int(element.get('address'))
+        if addr is not None:
+            return addr
+        
+        # Method 3: mem/memory child element - first of each tag in one walk
+        found = {}
+        for child in element.iter():
+            if child.tag in ADDRESS_TAGS and child.tag not in found:
+                found[child.tag] = child
+        for tag in ADDRESS_TAGS:
+            mem = found.get(tag)
             if mem is not None and mem.text:
-                try:
-                    addr = mem.text.strip()
-                    return int(addr, 16) if addr.startswith('0x') else int(addr)
-                except ValueError:
-                    pass
+                addr = _parse_int(mem.text.strip())
+                if addr is not None:
+                    return addr
         
         return None
     
@@ -382,65 +887,21 @@ class UniversalXDFExporter:
             'minor_stride': 0
         }
         
-        embedded = element.find('.//EMBEDDEDDATA')
+        embedded = element.find('EMBEDDEDDATA')
         if embedded is None:
             return result
         
-        # Address
-        addr_str = embedded.get('mmedaddress', '')
-        if addr_str:
-            try:
-                result['address'] = int(addr_str, 16) if addr_str.startswith('0x') else int(addr_str)
-            except ValueError:
-                pass
-        
-        # Size in bits
-        size_str = embedded.get('mmedelementsizebits', '')
-        if size_str:
-            try:
-                result['size_bits'] = int(size_str)
-            except ValueError:
-                pass
+        # Integer attributes (hex or decimal); missing or malformed values
+        # keep the defaults above. Strides may be NEGATIVE (BUG FIX #6, BMW)
+        attrib = embedded.attrib
+        for attr, key in EMBEDDED_INT_ATTRS:
+            result[key] = _parse_int(attrib.get(attr), result[key])
         
         # Type flags (signedness and endianness)
-        flags_str = embedded.get('mmedtypeflags', '0x00')
-        try:
-            flags = int(flags_str, 16) if flags_str.startswith('0x') else int(flags_str)
+        flags = _parse_int(attrib.get('mmedtypeflags', '0x00'))
+        if flags is not None:
             result['lsb_first'] = bool(flags & 0x01)  # Bit 0 = LSB first
             result['signed'] = bool(flags & 0x02)     # Bit 1 = Signed
-        except ValueError:
-            pass
-        
-        # Row/column counts for tables
-        row_str = embedded.get('mmedrowcount', '')
-        if row_str:
-            try:
-                result['row_count'] = int(row_str)
-            except ValueError:
-                pass
-        
-        col_str = embedded.get('mmedcolcount', '')
-        if col_str:
-            try:
-                result['col_count'] = int(col_str)
-            except ValueError:
-                pass
-        
-        # Strides for non-contiguous data
-        # BUG FIX #6: Support NEGATIVE strides (BMW backwards addressing)
-        major_str = embedded.get('mmedmajorstridebits', '')
-        if major_str:
-            try:
-                result['major_stride'] = int(major_str)  # Can be negative!
-            except ValueError:
-                pass
-        
-        minor_str = embedded.get('mmedminorstridebits', '')
-        if minor_str:
-            try:
-                result['minor_stride'] = int(minor_str)
-            except ValueError:
-                pass
         
         return result
     
@@ -480,28 +941,54 @@ class UniversalXDFExporter:
         Returns:
             int: Actual file offset to read from
         """
-        if self.base_offset == 0:
-            return xdf_address
+        return self._addr_to_offset(xdf_address)
+    
+    def _select_addr_translation(self):
+        """
+        Bind self._addr_to_offset for the current BASEOFFSET settings
+        
+        The offset and subtract flag are fixed once the header is parsed,
+        so the branch is taken here once rather than on every table cell.
+        """
+        base_offset = self.base_offset
+        
+        # Signed shift from XDF address to file offset, for batch callers
+        if base_offset == 0:
+            self._addr_shift = 0
+        else:
+            self._addr_shift = -base_offset if self.base_subtract == 1 else base_offset
+        
+        if base_offset == 0:
+            self._addr_to_offset = lambda xdf_address: xdf_address
+            return
         
         # XDF addresses are ECU memory addresses
         # BASEOFFSET + subtract flag determines translation
-        if self.base_subtract == 1:
+        def subtract_offset(xdf_address: int) -> int:
             # subtract=1: ECU addresses start at offset, file starts at 0
-            file_offset = xdf_address - self.base_offset
-        else:
+            file_offset = xdf_address - base_offset
+            if file_offset < 0:
+                return self._negative_file_offset(xdf_address, file_offset)
+            return file_offset
+        
+        def add_offset(xdf_address: int) -> int:
             # subtract=0: File has padding/header before calibration
-            file_offset = xdf_address + self.base_offset
+            file_offset = xdf_address + base_offset
+            if file_offset < 0:
+                return self._negative_file_offset(xdf_address, file_offset)
+            return file_offset
         
+        self._addr_to_offset = subtract_offset if self.base_subtract == 1 else add_offset
+    
+    def _negative_file_offset(self, xdf_address: int, file_offset: int) -> int:
+        """Warn about a translated offset below zero and fall back to the raw address"""
         # Sanity check - file offset should be non-negative
-        if file_offset < 0:
-            self.logger.warning(
-                f"Calculated negative file offset: XDF addr 0x{xdf_address:X} "
-                f"{'- ' if self.base_subtract else '+ '}{self.base_offset} = {file_offset}. "
-                f"Using raw address."
-            )
-            return xdf_address  # Fall back to raw address
-        
-        return file_offset
+        self.logger.warning(
+            f"Calculated negative file offset: XDF addr 0x{xdf_address:X} "
+            f"{'- ' if self.base_subtract else '+ '}{self.base_offset} = {file_offset}. "
+            f"Using raw address."
+        )
+        return xdf_address  # Fall back to raw address
     
     def _get_title(self, element) -> str:
         """
@@ -513,9 +1000,18 @@ class UniversalXDFExporter:
         Returns:
             str: Title or "Unknown"
         """
-        # Try multiple possible tags
-        for tag in ['title', 'name', 'label', 'desc']:
-            elem = element.find(f'.//{tag}')
+        # Try multiple possible tags in one walk; the first <title> with
+        # text wins outright, otherwise fall back in TITLE_TAGS order
+        found = {}
+        for child in element.iter():
+            tag = child.tag
+            if tag in TITLE_TAGS and tag not in found:
+                if tag == 'title' and child.text:
+                    return child.text.strip()
+                found[tag] = child
+        
+        for tag in TITLE_TAGS:
+            elem = found.get(tag)
             if elem is not None and elem.text:
                 return elem.text.strip()
         
@@ -531,259 +1027,257 @@ class UniversalXDFExporter:
         Returns:
             str: Category name
         """
-        cat_mem = element.find('.//CATEGORYMEM')
-        if cat_mem is not None:
-            cat_idx = cat_mem.get('category')
-            if cat_idx:
-                try:
-                    idx = int(cat_idx, 16) if cat_idx.startswith('0x') else int(cat_idx)
-                    return self.categories.get(idx, 'Unknown')
-                except ValueError:
-                    pass
-        return 'Uncategorized'
-    
-    def _extract_constants(self):
-        """Extract all constants (SCALAR values) with bug fixes"""
-        for const in self.xdf_root.findall('.//XDFCONSTANT'):
-            # Parse embedded data for full info
-            embedded = self._parse_embedded_data(const)
-            address = embedded['address']
-            
-            # BUG FIX #5: Validate address exists before processing
-            if address is None:
-                title = self._get_title(const)
-                self.logger.warning(f"Constant '{title}' has no address, skipping")
-                continue
-            
+        cat_mem = element.find('CATEGORYMEM')
+        if cat_mem is None:
+            return 'Uncategorized'
+        
+        # Memoized on the raw attribute text; most elements share a handful
+        idx_str = cat_mem.get('category')
+        name = self._cat_by_str.get(idx_str)
+        if name is None:
+            idx = _parse_int(idx_str)
+            name = self.categories.get(idx, 'Unknown') if idx is not None else 'Uncategorized'
+            self._cat_by_str[idx_str] = name
+        return name
+    
+    def _handle_constant(self, const):
+        """Extract a constant (SCALAR value) with bug fixes"""
+        # Parse embedded data for full info
+        embedded = self._parse_embedded_data(const)
+        address = embedded['address']
+        
+        # BUG FIX #5: Validate address exists before processing
+        if address is None:
             title = self._get_title(const)
-            category = self._get_category_name(const)
-            
-            # Get unit
-            unit_elem = const.find('.//units')
-            unit = unit_elem.text.strip() if unit_elem is not None and unit_elem.text else ""
-            
-            # Get math equation
-            math_elem = const.find('.//MATH')
-            equation = None
-            if math_elem is not None:
-                equation = math_elem.get('equation', '')
-            
-            # Get decimal places for precision (BUG FIX #9)
-            decimalpl = 2  # Default
-            dec_elem = const.find('.//decimalpl')
-            if dec_elem is not None and dec_elem.text:
-                try:
-                    decimalpl = int(dec_elem.text.strip())
-                except ValueError:
-                    pass
-            
-            # BUG FIX #8: Extract range validation metadata
-            min_val = None
-            max_val = None
-            rangelow_elem = const.find('.//rangelow')
-            rangehigh_elem = const.find('.//rangehigh')
-            
-            if rangelow_elem is not None and rangelow_elem.text:
+            self.logger.warning(f"Constant '{title}' has no address, skipping")
+            return
+        
+        title = self._get_title(const)
+        category = self._get_category_name(const)
+        
+        # Get unit
+        unit_elem = const.find('units')
+        unit = sys.intern(unit_elem.text.strip()) if unit_elem is not None and unit_elem.text else ""
+        
+        # Get math equation
+        math_elem = const.find('MATH')
+        equation = None
+        if math_elem is not None:
+            equation = sys.intern(math_elem.get('equation', ''))
+        
+        # Get decimal places for precision (BUG FIX #9)
+        decimalpl = 2  # Default
+        dec_elem = const.find('decimalpl')
+        if dec_elem is not None and dec_elem.text:
+            decimalpl = _parse_int(dec_elem.text.strip(), decimalpl)
+        
+        # BUG FIX #8: Extract range validation metadata
+        min_val = None
+        max_val = None
+        rangelow_elem = const.find('rangelow')
+        rangehigh_elem = const.find('rangehigh')
+        
+        if rangelow_elem is not None and rangelow_elem.text:
+            try:
+                min_val = float(rangelow_elem.text.strip())
+            except ValueError:
+                pass
+        if rangehigh_elem is not None and rangehigh_elem.text:
+            try:
+                max_val = float(rangehigh_elem.text.strip())
+            except ValueError:
+                pass
+        
+        # Legacy min/max tags (fallback)
+        if min_val is None:
+            min_elem = const.find('min')
+            if min_elem is not None and min_elem.text:
                 try:
-                    min_val = float(rangelow_elem.text.strip())
+                    min_val = float(min_elem.text.strip())
                 except ValueError:
                     pass
-            if rangehigh_elem is not None and rangehigh_elem.text:
+        if max_val is None:
+            max_elem = const.find('max')
+            if max_elem is not None and max_elem.text:
                 try:
-                    max_val = float(rangehigh_elem.text.strip())
+                    max_val = float(max_elem.text.strip())
                 except ValueError:
                     pass
-            
-            # Legacy min/max tags (fallback)
-            if min_val is None:
-                min_elem = const.find('.//min')
-                if min_elem is not None and min_elem.text:
-                    try:
-                        min_val = float(min_elem.text.strip())
-                    except ValueError:
-                        pass
-            if max_val is None:
-                max_elem = const.find('.//max')
-                if max_elem is not None and max_elem.text:
-                    try:
-                        max_val = float(max_elem.text.strip())
-                    except ValueError:
-                        pass
-            
-            self.elements['constants'].append({
-                'title': title,
-                'address': address,
-                'size': embedded['size_bits'],
-                'signed': embedded['signed'],
-                'lsb_first': embedded['lsb_first'],
-                'unit': unit,
-                'equation': equation,
-                'category': category,
-                'decimalpl': decimalpl,
-                'min': min_val,
-                'max': max_val
-            })
+        
+        self.elements['constants'].append({
+            'title': title,
+            'title_md': title.replace('|', '\\|'),  # Escaped for Markdown tables
+            'address': address,
+            'size': embedded['size_bits'],
+            'signed': embedded['signed'],
+            'lsb_first': embedded['lsb_first'],
+            'unit': unit,
+            'equation': equation,
+            'category': category,
+            'decimalpl': decimalpl,
+            'min': min_val,
+            'max': max_val
+        })
     
-    def _extract_flags(self):
-        """Extract all flags (bit flags)"""
-        for flag in self.xdf_root.findall('.//XDFFLAG'):
-            address = self._get_address(flag)
-            if address is None:
-                continue
-            
-            title = self._get_title(flag)
-            category = self._get_category_name(flag)
-            
-            # Get mask
-            mask_elem = flag.find('.//mask')
-            mask = 0x01  # Default mask
-            if mask_elem is not None and mask_elem.text:
-                try:
-                    mask_str = mask_elem.text.strip()
-                    mask = int(mask_str, 16) if mask_str.startswith('0x') else int(mask_str)
-                except ValueError:
-                    pass
-            
-            self.elements['flags'].append({
-                'title': title,
-                'address': address,
-                'mask': mask,
-                'category': category
-            })
+    def _handle_flag(self, flag):
+        """Extract a flag (bit flag)"""
+        address = self._get_address(flag)
+        if address is None:
+            return
+        
+        title = self._get_title(flag)
+        category = self._get_category_name(flag)
+        
+        # Get mask
+        mask_elem = flag.find('mask')
+        mask = 0x01  # Default mask
+        if mask_elem is not None and mask_elem.text:
+            mask = _parse_int(mask_elem.text.strip(), mask)
+        
+        self.elements['flags'].append({
+            'title': title,
+            'title_md': title.replace('|', '\\|'),  # Escaped for Markdown tables
+            'address': address,
+            'mask': mask,
+            'category': category
+        })
     
-    def _extract_axis_labels(self, axis_elem) -> List[float]:
+    def _extract_axis_labels(self, axis_elem, equation: Optional[str] = None,
+                             affine: Optional[Tuple] = None) -> List[float]:
         """
         Extract and process axis label values
         
         Args:
             axis_elem: XDF XDFAXIS element
+            equation: Label math equation (from the axis MATH element)
+            affine: Precompiled affine form of equation, if any
             
         Returns:
             List[float]: Processed label values
         """
-        labels = []
-        
-        # Get math equation for labels
-        math_elem = axis_elem.find('.//MATH')
-        equation = None
-        if math_elem is not None:
-            equation = math_elem.get('equation', '')
-        
-        # Extract all label values
-        for label_elem in axis_elem.findall('.//LABEL'):
+        # Extract all raw label values
+        raw_values = []
+        for label_elem in axis_elem.findall('LABEL'):
             value_str = label_elem.get('value', '')
             if not value_str:
                 continue
-            
             try:
-                # Parse raw value
-                raw_value = float(value_str)
-                
-                # Apply math equation if present
-                if equation:
-                    final_value, error = self.evaluate_math(equation, raw_value)
-                    if final_value is not None:
-                        labels.append(final_value)
-                    else:
-                        labels.append(raw_value)
-                else:
-                    labels.append(raw_value)
-                    
+                raw_values.append(float(value_str))
             except ValueError:
                 continue
         
+        if not equation:
+            return raw_values
+        
+        # Affine equations are applied in one pass; anything non-finite
+        # falls back to the raw value, as evaluate_math failures do
+        if affine is not None:
+            return [
+                value if math.isfinite(value) else raw_value
+                for raw_value, value in zip(raw_values, _apply_affine(raw_values, affine))
+            ]
+        
+        # Apply math equation, keeping the raw value if it fails
+        labels = []
+        for raw_value in raw_values:
+            final_value, error = self.evaluate_math(equation, raw_value)
+            labels.append(final_value if final_value is not None else raw_value)
+        
         return labels
     
-    def _extract_tables(self):
-        """Extract all tables (2D/3D lookup tables)"""
-        for table in self.xdf_root.findall('.//XDFTABLE'):
-            title = self._get_title(table)
-            category = self._get_category_name(table)
+    def _handle_table(self, table):
+        """Extract a table (2D/3D lookup table)"""
+        title = self._get_title(table)
+        category = self._get_category_name(table)
+        
+        # Get decimal places for precision
+        # Deliberately a descendant search: XDFTABLE rarely carries its own
+        # decimalpl, so the first axis value becomes the table default
+        decimalpl = 2  # Default
+        dec_elem = table.find('.//decimalpl')
+        if dec_elem is not None and dec_elem.text:
+            decimalpl = _parse_int(dec_elem.text.strip(), decimalpl)
+        
+        # Extract axes information
+        axes = {}
+        for axis in table.findall('XDFAXIS'):
+            axis_id = sys.intern(axis.get('id', 'unknown'))  # 'x'/'y'/'z' keys
             
-            # Get decimal places for precision
-            decimalpl = 2  # Default
-            dec_elem = table.find('.//decimalpl')
-            if dec_elem is not None and dec_elem.text:
-                try:
-                    decimalpl = int(dec_elem.text.strip())
-                except ValueError:
-                    pass
+            # Parse EMBEDDEDDATA for full info
+            embedded = self._parse_embedded_data(axis)
             
-            # Extract axes information
-            axes = {}
-            for axis in table.findall('.//XDFAXIS'):
-                axis_id = axis.get('id', 'unknown')
-                
-                # Parse EMBEDDEDDATA for full info
-                embedded = self._parse_embedded_data(axis)
-                
-                # Get axis size/count from indexcount element
-                count_elem = axis.find('.//indexcount')
-                count = 1
-                if count_elem is not None and count_elem.text:
-                    try:
-                        count = int(count_elem.text.strip())
-                    except ValueError:
-                        pass
-                
-                # For Z-axis, also check row/col counts from EMBEDDEDDATA
-                if axis_id == 'z':
-                    if embedded['row_count'] > 1:
-                        count = embedded['row_count'] * embedded['col_count']
-                
-                # Get axis unit
-                unit_elem = axis.find('.//units')
-                unit = ""
-                if unit_elem is not None and unit_elem.text:
-                    unit = unit_elem.text.strip()
-                
-                # Get math equation
-                math_elem = axis.find('.//MATH')
-                equation = None
-                if math_elem is not None:
-                    equation = math_elem.get('equation', '')
-                
-                # Get axis-specific decimal places
-                axis_decimalpl = decimalpl  # Default to table's decimalpl
-                axis_dec_elem = axis.find('.//decimalpl')
-                if axis_dec_elem is not None and axis_dec_elem.text:
-                    try:
-                        axis_decimalpl = int(axis_dec_elem.text.strip())
-                    except ValueError:
-                        pass
-                
-                # Extract axis labels with processing
-                axis_labels = self._extract_axis_labels(axis)
-                
-                axes[axis_id] = {
-                    'address': embedded['address'],
-                    'count': count,
-                    'unit': unit,
-                    'equation': equation,
-                    'labels': axis_labels,
-                    'size_bits': embedded['size_bits'],
-                    'signed': embedded['signed'],
-                    'lsb_first': embedded['lsb_first'],
-                    'row_count': embedded['row_count'],
-                    'col_count': embedded['col_count'],
-                    'decimalpl': axis_decimalpl
-                }
+            # Get axis size/count from indexcount element
+            count_elem = axis.find('indexcount')
+            count = 1
+            if count_elem is not None and count_elem.text:
+                count = _parse_int(count_elem.text.strip(), count)
             
-            # Get Z-axis (data) information
-            z_axis = axes.get('z', {})
-            data_address = z_axis.get('address')
+            # For Z-axis, also check row/col counts from EMBEDDEDDATA
+            if axis_id == 'z':
+                if embedded['row_count'] > 1:
+                    count = embedded['row_count'] * embedded['col_count']
             
-            if data_address is not None:
-                self.elements['tables'].append({
-                    'title': title,
-                    'category': category,
-                    'axes': axes,
-                    'decimalpl': decimalpl
-                })
+            # Get axis unit
+            unit_elem = axis.find('units')
+            unit = ""
+            if unit_elem is not None and unit_elem.text:
+                unit = sys.intern(unit_elem.text.strip())
+            
+            # Get math equation
+            math_elem = axis.find('MATH')
+            equation = None
+            if math_elem is not None:
+                equation = sys.intern(math_elem.get('equation', ''))
+            
+            # Get axis-specific decimal places
+            axis_decimalpl = decimalpl  # Default to table's decimalpl
+            axis_dec_elem = axis.find('decimalpl')
+            if axis_dec_elem is not None and axis_dec_elem.text:
+                axis_decimalpl = _parse_int(axis_dec_elem.text.strip(), axis_decimalpl)
+            
+            # Extract axis labels with processing
+            affine = _try_affine(equation) if equation else None
+            axis_labels = self._extract_axis_labels(axis, equation, affine)
+            
+            # Typed layout of one element (e.g. '>H'), resolved once here so
+            # the table reader can unpack whole blocks (byte order included)
+            # in a single call
+            typecode = STRUCT_TYPECODES.get((embedded['size_bits'], embedded['signed']))
+            struct_fmt = None
+            if typecode is not None:
+                struct_fmt = ('<' if embedded['lsb_first'] else '>') + typecode
+            
+            axes[axis_id] = {
+                'address': embedded['address'],
+                'count': count,
+                'unit': unit,
+                'equation': equation,
+                'affine': affine,
+                'labels': axis_labels,
+                'size_bits': embedded['size_bits'],
+                'signed': embedded['signed'],
+                'lsb_first': embedded['lsb_first'],
+                'row_count': embedded['row_count'],
+                'col_count': embedded['col_count'],
+                'struct_fmt': struct_fmt,
+                'decimalpl': axis_decimalpl
+            }
+        
+        # Get Z-axis (data) information
+        z_axis = axes.get('z', {})
+        data_address = z_axis.get('address')
+        
+        if data_address is not None:
+            self.elements['tables'].append({
+                'title': title,
+                'category': category,
+                'axes': axes,
+                'decimalpl': decimalpl
+            })
     
-    def _extract_patches(self):
+    def _handle_patch(self, patch):
         """
-        Extract all XDFPATCH elements (Community Patchlist support)
+        Extract an XDFPATCH element (Community Patchlist support)
         
         XDFPATCH elements define binary patches that can be applied/unapplied.
         Each patch has:
@@ -793,55 +1287,55 @@ class UniversalXDFExporter:
         
         This checks the BIN to determine if each patch is applied or not.
         """
-        for patch in self.xdf_root.findall('.//XDFPATCH'):
-            title = self._get_title(patch)
-            category = self._get_category_name(patch)
-            
-            # Get description
-            desc_elem = patch.find('.//description')
-            description = ""
-            if desc_elem is not None and desc_elem.text:
-                description = desc_elem.text.strip()
-                # Clean up XML entities
-                description = description.replace('&#013;&#010;', '\n')
-                description = description.replace('&#013;', '\r')
-                description = description.replace('&#010;', '\n')
+        title = self._get_title(patch)
+        category = self._get_category_name(patch)
+        
+        # Get description
+        desc_elem = patch.find('description')
+        description = ""
+        if desc_elem is not None and desc_elem.text:
+            description = desc_elem.text.strip()
+            # Clean up XML entities
+            description = description.replace('&#013;&#010;', '\n')
+            description = description.replace('&#013;', '\r')
+            description = description.replace('&#010;', '\n')
+        
+        # Extract all patch entries
+        entries = list(self._iter_patch_entries(patch))
+        
+        if entries:
+            # Check if patch is applied
+            patch_status = self._check_patch_status(entries)
             
-            # Extract all patch entries
-            entries = []
-            for entry in patch.findall('.//XDFPATCHENTRY'):
-                entry_name = entry.get('name', 'Unknown')
-                addr_str = entry.get('address', '0')
-                size_str = entry.get('datasize', '0')
-                patch_data = entry.get('patchdata', '')
-                base_data = entry.get('basedata', '')
-                
-                try:
-                    # Parse address and size
-                    address = int(addr_str, 16) if addr_str.startswith('0x') else int(addr_str)
-                    datasize = int(size_str, 16) if size_str.startswith('0x') else int(size_str)
-                    
-                    entries.append({
-                        'name': entry_name,
-                        'address': address,
-                        'datasize': datasize,
-                        'patchdata': patch_data.upper(),
-                        'basedata': base_data.upper()
-                    })
-                except ValueError:
-                    continue
+            self.elements['patches'].append({
+                'title': title,
+                'description': description,
+                'category': category,
+                'entries': entries,
+                'status': patch_status
+            })
+    
+    def _iter_patch_entries(self, patch):
+        """
+        Yield one dict per valid XDFPATCHENTRY of a patch
+        
+        Entries whose address or datasize cannot be parsed are skipped.
+        """
+        for entry in patch.findall('XDFPATCHENTRY'):
+            # Parse address and size
+            address = _parse_int(entry.get('address', '0'))
+            datasize = _parse_int(entry.get('datasize', '0'))
+            if address is None or datasize is None:
+                continue
             
-            if entries:
-                # Check if patch is applied
-                patch_status = self._check_patch_status(entries)
-                
-                self.elements['patches'].append({
-                    'title': title,
-                    'description': description,
-                    'category': category,
-                    'entries': entries,
-                    'status': patch_status
-                })
+            # Hex data decoded once here so the status check compares raw bytes
+            yield {
+                'name': entry.get('name', 'Unknown'),
+                'address': address,
+                'datasize': datasize,
+                'patch_bytes': _hex_bytes(entry.get('patchdata', '')),
+                'base_bytes': _hex_bytes(entry.get('basedata', ''))
+            }
     
     def _check_patch_status(self, entries: List[Dict]) -> str:
         """
@@ -860,28 +1354,40 @@ class UniversalXDFExporter:
         base_count = 0
         total = len(entries)
         
+        # One view for all entries: slices neither copy nor hex-encode,
+        # even when bin_data was assigned as plain bytes
+        bin_view = memoryview(self.bin_data)
+        bin_size = self.bin_size
+        to_offset = self._addr_to_offset
+        
         for entry in entries:
             address = entry['address']
             datasize = entry['datasize']
-            patch_data = entry['patchdata']
-            base_data = entry['basedata']
+            patch_bytes = entry['patch_bytes']
+            base_bytes = entry['base_bytes']
             
             # Convert address to file offset
-            file_offset = self._xdf_addr_to_file_offset(address)
+            file_offset = to_offset(address)
             
             # Validate offset
-            if file_offset < 0 or file_offset + datasize > self.bin_size:
+            if file_offset < 0 or file_offset + datasize > bin_size:
                 continue
             
-            # Read actual bytes from BIN
-            actual_bytes = self.bin_data[file_offset:file_offset + datasize]
-            actual_hex = actual_bytes.hex().upper()
+            # Read actual bytes from BIN and compare them directly (memcmp)
+            actual_bytes = bin_view[file_offset:file_offset + datasize]
             
             # Check if matches patch or base data
-            if patch_data and actual_hex == patch_data:
+            if patch_bytes and actual_bytes == patch_bytes:
                 applied_count += 1
-            elif base_data and actual_hex == base_data:
+            elif base_bytes and actual_bytes == base_bytes:
                 base_count += 1
+            else:
+                continue
+            
+            # One applied and one original entry already rule out both
+            # 'applied' and 'not_applied'; the rest cannot change the result
+            if applied_count and base_count:
+                return 'partial'
         
         # Determine status
         if applied_count == total:
@@ -897,6 +1403,14 @@ class UniversalXDFExporter:
         else:
             return 'unknown'
 
+    @classmethod
+    def _struct(cls, fmt: str) -> struct.Struct:
+        """Return the cached struct.Struct for a format string"""
+        layout = cls._STRUCTS.get(fmt)
+        if layout is None:
+            layout = cls._STRUCTS[fmt] = struct.Struct(fmt)
+        return layout
+    
     def read_value_from_bin(self, address: int, size_bits: int, 
                            signed: bool = False,
                            lsb_first: bool = False) -> Optional[int]:
@@ -913,8 +1427,20 @@ class UniversalXDFExporter:
             int: Value or None if error
         """
         # Convert XDF address to actual file offset
-        file_offset = self._xdf_addr_to_file_offset(address)
+        file_offset = self._addr_to_offset(address)
+        
+        # Single bytes (flags, 8-bit scalars) index the BIN directly
+        if size_bits == 8 and 0 <= file_offset < self.bin_size:
+            value = self.bin_data[file_offset]
+            return value - 256 if signed and value >= 128 else value
         
+        typecode = STRUCT_TYPECODES.get((size_bits, bool(signed)))
+        layout = self._struct(('<' if lsb_first else '>') + typecode) if typecode else None
+        return self._unpack_at(address, file_offset, size_bits, layout)
+    
+    def _unpack_at(self, address: int, file_offset: int, size_bits: int,
+                   layout: Optional[struct.Struct]) -> Optional[int]:
+        """Bounds-check and unpack one value at a file offset (None if unreadable)"""
         if not 0 <= file_offset < self.bin_size:
             self.logger.warning(
                 f"Address 0x{address:04X} -> file offset 0x{file_offset:04X} out of range "
@@ -930,33 +1456,81 @@ class UniversalXDFExporter:
             )
             return None
         
-        try:
-            data = self.bin_data[file_offset:file_offset + size_bytes]
-            
-            # Determine endianness prefix: < for little-endian, > for big-endian
-            endian = '<' if lsb_first else '>'
-            
-            # Unpack based on size and signedness
-            if size_bits == 8:
-                fmt = 'b' if signed else 'B'
-                value = struct.unpack(f'{endian}{fmt}', data)[0]
-            elif size_bits == 16:
-                fmt = 'h' if signed else 'H'
-                value = struct.unpack(f'{endian}{fmt}', data)[0]
-            elif size_bits == 32:
-                fmt = 'i' if signed else 'I'
-                value = struct.unpack(f'{endian}{fmt}', data)[0]
+        if layout is None:
+            self.logger.warning(f"Unsupported size: {size_bits} bits")
+            return None
+        
+        # Unpack in place from the BIN (no slice), little- or big-endian
+        return layout.unpack_from(self.bin_data, file_offset)[0]
+    
+    def _read_constant_values(self) -> List[Optional[int]]:
+        """
+        Read the raw value of every constant in one pass
+        
+        Struct layouts are resolved once per (size, signed, byte order)
+        group and in-range values are unpacked directly; anything else
+        goes through the same checks and warnings as read_value_from_bin.
+        
+        Returns:
+            List: Raw value (or None) per entry of elements['constants']
+        """
+        bin_data, bin_size = self.bin_data, self.bin_size
+        addr_to_offset = self._addr_to_offset
+        layouts = {}
+        values = []
+        append = values.append
+        
+        # Addresses and sizes come from the element dicts themselves, so the
+        # result always lines up with elements['constants']
+        for const in self.elements['constants']:
+            address, size_bits = const['address'], const['size']
+            key = (size_bits, bool(const.get('signed', False)), bool(const.get('lsb_first', False)))
+            if key in layouts:
+                layout = layouts[key]
             else:
-                self.logger.warning(f"Unsupported size: {size_bits} bits")
-                return None
-            
-            return value
+                typecode = STRUCT_TYPECODES.get(key[:2])
+                layout = layouts[key] = (
+                    self._struct(('<' if key[2] else '>') + typecode) if typecode else None
+                )
             
-        except struct.error as e:
-            self.logger.warning(
-                f"Failed to unpack value at 0x{address:04X}: {e}"
-            )
-            return None
+            file_offset = addr_to_offset(address)
+            if layout is not None and 0 <= file_offset and file_offset + layout.size <= bin_size:
+                append(layout.unpack_from(bin_data, file_offset)[0])
+            else:
+                append(self._unpack_at(address, file_offset, size_bits, layout))
+        
+        return values
+    
+    def _read_flag_bytes(self) -> List[Optional[int]]:
+        """
+        Read the byte behind every flag in one pass
+        
+        Flags that share an address (one bit each of the same byte) reuse
+        the byte read for the first of them.
+        
+        Returns:
+            List: Byte value (or None) per entry of elements['flags']
+        """
+        bin_data, bin_size = self.bin_data, self.bin_size
+        addr_to_offset = self._addr_to_offset
+        layout = self._struct('>B')
+        byte_at = {}
+        values = []
+        
+        # Addresses come from the flag dicts, so the result always lines up
+        # with elements['flags']
+        for flag in self.elements['flags']:
+            address = flag['address']
+            byte_value = byte_at.get(address)
+            if byte_value is None:
+                file_offset = addr_to_offset(address)
+                if 0 <= file_offset < bin_size:
+                    byte_value = byte_at[address] = bin_data[file_offset]
+                else:
+                    byte_value = self._unpack_at(address, file_offset, 8, layout)
+            values.append(byte_value)
+        
+        return values
     
     def _read_table_data(self, table: Dict) -> Optional[List[List[float]]]:
         """Read full 2D/3D table data from binary with NEGATIVE STRIDE support (BUG FIX #6)"""
@@ -1012,27 +1586,58 @@ class UniversalXDFExporter:
         else:
             start_address = base_address
         
-        # Read table data
+        y_labels = y_axis.get('labels', [])
+        x_labels = x_axis.get('labels', [])
+        
+        # Contiguous layout: unpack the whole block with one struct call
+        if major_stride >= 0:
+            raw_block = self._read_table_block(
+                base_address, rows * cols, size_bytes, z_axis.get('struct_fmt')
+            )
+            if raw_block is not None:
+                if not math_eq:
+                    return [
+                        [float(raw_value) for raw_value in raw_block[row * cols:(row + 1) * cols]]
+                        for row in range(rows)
+                    ]
+                return self._convert_table_block(
+                    math_eq, z_axis.get('affine'), raw_block, rows, cols, y_labels, x_labels
+                )
+        
+        # Read table data cell by cell (negative stride, unsupported element
+        # size, or data running past the end of the BIN)
+        cell_count = rows * cols
+        if major_stride < 0:
+            # BUG FIX #6: Calculate addresses with support for negative stride
+            row_step = abs(major_stride_bytes) * cols
+            addresses = [
+                start_address - (row * row_step) + (col * minor_stride_bytes)
+                for row in range(rows) for col in range(cols)
+            ]
+        else:
+            addresses = [base_address + index * size_bytes for index in range(cell_count)]
+        
+        # BASEOFFSET translation as plain arithmetic; the negative-offset
+        # fallback (and its warning) is applied only to cells actually reached
+        shift = self._addr_shift
+        
+        typecode = STRUCT_TYPECODES.get((size_bits, bool(signed)))
+        layout = self._struct(('<' if lsb_first else '>') + typecode) if typecode else None
+        bin_size = self.bin_size
+        
         data = []
         
         for row in range(rows):
             row_data = []
             for col in range(cols):
-                # BUG FIX #6: Calculate offset with support for negative stride
-                if major_stride < 0:
-                    offset = start_address - (row * abs(major_stride_bytes) * cols) + (col * minor_stride_bytes)
-                else:
-                    offset = (row * cols + col) * size_bytes
-                    address = base_address + offset
-                
-                if major_stride < 0:
-                    address = offset
-                
-                # Convert to file offset for bounds checking
-                file_offset = self._xdf_addr_to_file_offset(address)
+                index = row * cols + col
+                address = addresses[index]
+                file_offset = address + shift
+                if file_offset < 0 and shift:
+                    file_offset = self._negative_file_offset(address, file_offset)
                 
                 # Validate file offset (not the raw XDF address)
-                if file_offset + size_bytes > self.bin_size:
+                if file_offset + size_bytes > bin_size:
                     self.logger.warning(
                         f"Table '{table['title']}' file offset 0x{file_offset:04X} "
                         f"(from XDF addr 0x{address:04X}) out of bounds"
@@ -1040,47 +1645,161 @@ class UniversalXDFExporter:
                     return None
                 
                 # Read raw value with proper signed/endian settings
-                raw_value = self.read_value_from_bin(
-                    address, size_bits, signed=signed, lsb_first=lsb_first
-                )
+                raw_value = self._unpack_at(address, file_offset, size_bits, layout)
                 if raw_value is None:
                     row_data.append(0.0)
                     continue
                 
-                # BUG FIX #7: Apply math equation with axis context for multi-variable support
-                if math_eq:
-                    axis_context = {
-                        'row_index': row,
-                        'col_index': col,
-                        'y_axis_value': y_axis.get('labels', [])[row] if row < len(y_axis.get('labels', [])) else 0,
-                        'x_axis_value': x_axis.get('labels', [])[col] if col < len(x_axis.get('labels', [])) else 0
-                    }
-                    final_value, _ = self.evaluate_math(math_eq, raw_value, axis_context)
-                    if final_value is not None:
-                        row_data.append(final_value)
-                    else:
-                        row_data.append(float(raw_value))
-                else:
-                    row_data.append(float(raw_value))
+                row_data.append(
+                    self._table_cell_value(math_eq, raw_value, row, col, y_labels, x_labels)
+                )
             
             data.append(row_data)
         
         return data
     
+    def _get_table_data(self, table: Dict) -> Optional[List[List[float]]]:
+        """
+        Return _read_table_data(table), decoded once per table
+        
+        Text, JSON and Markdown exports of the same run ('all' format)
+        share the result; callers must not modify the returned rows.
+        """
+        cached = self._table_data_cache.get(id(table))
+        if cached is not None and cached[0] is table:
+            return cached[1]
+        data = self._read_table_data(table)
+        self._table_data_cache[id(table)] = [table, data, None]
+        return data
+    
+    def _read_table_block(self, address: int, count: int, size_bytes: int,
+                          struct_fmt: Optional[str]) -> Optional[Tuple[int, ...]]:
+        """
+        Unpack count contiguous table elements starting at an XDF address
+        
+        Byte order is part of struct_fmt ('<' LSB first, '>' MSB first), so
+        the single unpack also converts every element to a native int; no
+        per-cell byte swapping happens anywhere on this path.
+        
+        Args:
+            address: XDF address of the first element
+            count: Number of elements
+            size_bytes: Element size in bytes
+            struct_fmt: Element layout from the axis dict (e.g. '>H')
+            
+        Returns:
+            Tuple of raw values, or None if the block cannot be read in one
+            piece (unsupported size, out of range, or needing the
+            negative-offset fallback) and must be read cell by cell
+        """
+        if struct_fmt is None or self.bin_data is None:
+            return None
+        
+        # Plain shift without the negative-offset warning; the cell path
+        # applies the fallback (and warns) for the cells it actually reads
+        start = address + self._addr_shift
+        end = start + count * size_bytes
+        if start < 0 or end > self.bin_size:
+            return None
+        
+        return self._struct(f'{struct_fmt[0]}{count}{struct_fmt[1:]}').unpack_from(self.bin_data, start)
+    
+    def _convert_table_block(self, math_eq: str, affine: Optional[Tuple], raw_block: Tuple[int, ...],
+                             rows: int, cols: int, y_labels: List[float],
+                             x_labels: List[float]) -> List[List[float]]:
+        """
+        Apply the Z-axis equation to a whole unpacked table
+        
+        Runs the compiled equation (or its affine form) straight over every
+        cell. If any cell raises or gives inf/nan, the table is converted
+        cell by cell through evaluate_math instead, so warnings and the
+        raw-value fallback are exactly as before.
+        """
+        values = None
+        
+        try:
+            func, _, divides_by_x = _make_equation_callable(math_eq)
+            if func is None:
+                values = [float(raw_value) for raw_value in raw_block]
+            elif not (divides_by_x and 0 in raw_block):
+                if affine is not None:
+                    results = _apply_affine(raw_block, affine)
+                else:
+                    # BUG FIX #7: axis context (A/B indices, Y/Z axis values)
+                    y_values = [y_labels[row] if row < len(y_labels) else 0 for row in range(rows)]
+                    x_values = [x_labels[col] if col < len(x_labels) else 0 for col in range(cols)]
+                    results = [
+                        func(raw_block[row * cols + col], row, col, y_values[row], x_values[col])
+                        for row in range(rows)
+                        for col in range(cols)
+                    ]
+                if all(map(math.isfinite, results)):
+                    values = [float(result) for result in results]
+        except Exception:
+            pass
+        
+        if values is None:
+            return [
+                [
+                    self._table_cell_value(math_eq, raw_block[row * cols + col], row, col, y_labels, x_labels)
+                    for col in range(cols)
+                ]
+                for row in range(rows)
+            ]
+        return [values[row * cols:(row + 1) * cols] for row in range(rows)]
+    
+    def _table_cell_value(self, math_eq: Optional[str], raw_value: int, row: int, col: int,
+                          y_labels: List[float], x_labels: List[float]) -> float:
+        """Convert one raw table cell, keeping the raw value if the math fails"""
+        if not math_eq:
+            return float(raw_value)
+        
+        # BUG FIX #7: Apply math equation with axis context for multi-variable support
+        axis_context = {
+            'row_index': row,
+            'col_index': col,
+            'y_axis_value': y_labels[row] if row < len(y_labels) else 0,
+            'x_axis_value': x_labels[col] if col < len(x_labels) else 0
+        }
+        final_value, _ = self.evaluate_math(math_eq, raw_value, axis_context)
+        if final_value is not None:
+            return final_value
+        return float(raw_value)
+    
+    def _read_and_validate_table(self, table: Dict) -> Tuple[Optional[List[List[float]]], Optional[Dict[str, Any]]]:
+        """
+        Read one table and run the suspicious-pattern checks on it
+        
+        Both results are cached with the table data, so every export
+        format reuses the same statistics.
+        
+        Returns:
+            Tuple: (table data, validation result), or (None, None) if the
+                   table could not be read
+        """
+        table_data = self._get_table_data(table)
+        if table_data is None:
+            return None, None
+        
+        cached = self._table_data_cache[id(table)]
+        if cached[2] is None:
+            cached[2] = self._validate_table_data(table, table_data)
+        return table_data, cached[2]
+    
     def _validate_table_data(self, table: Dict, data: List[List[float]]) -> Dict[str, Any]:
         """Validate table data for suspicious patterns"""
         if not data or not data[0]:
             return {'valid': True, 'warnings': []}
         
         # Flatten data for analysis
-        flat_data = [cell for row in data for cell in row]
-        
-        # Check for all zeros
-        all_zeros = all(cell == 0.0 for cell in flat_data)
+        flat_data = list(chain.from_iterable(data))
+        min_value = min(flat_data)
+        max_value = max(flat_data)
         
-        # Check for all same value
-        unique_values = set(flat_data)
-        all_same = len(unique_values) == 1
+        # Check for all same value (and, from that, all zeros)
+        all_same = min_value == max_value
+        all_zeros = all_same and min_value == 0.0
+        unique_count = 1 if all_same else len(set(flat_data))
         
         # Check for suspicious patterns
         warnings = []
@@ -1092,10 +1811,10 @@ class UniversalXDFExporter:
         
         # Calculate statistics
         stats = {
-            'min': min(flat_data),
-            'max': max(flat_data),
-            'avg': statistics.mean(flat_data),
-            'unique_count': len(unique_values)
+            'min': min_value,
+            'max': max_value,
+            'avg': _mean(flat_data),
+            'unique_count': unique_count
         }
         
         return {
@@ -1125,75 +1844,29 @@ class UniversalXDFExporter:
         Returns:
             Tuple[Optional[float], str]: (result, error_message)
         """
-        if axis_context is None:
-            axis_context = {}
-        
-        # BUG FIX #2: Strip XML entities (&#013;&#010; = CRLF, etc)
-        equation = re.sub(r'&#\d+;', '', equation)
-        equation = equation.strip()
-        
-        # BUG FIX #4: Handle null/empty equations
-        if not equation or equation.lower() in ('(null)', 'null', ''):
-            return float(raw_value), ""
-        
-        # Handle simple X passthrough
-        if equation.strip().upper() == 'X':
-            return float(raw_value), ""
-        
-        # BUG FIX #1: Pre-check for potential division by zero
-        if raw_value == 0 and re.search(r'/\s*[xX]\b', equation):
-            self.logger.warning(f"Potential division by zero in equation: {equation} (X=0)")
-            # Continue anyway, let exception handler catch actual errors
-        
         try:
-            equation_fixed = equation.strip()
+            func, equation, divides_by_x = _make_equation_callable(equation)
             
-            # Fix equations starting with operator (e.g., "*2**14" -> "X*2**14")
-            if equation_fixed.startswith(('*', '/', '+', '-')):
-                equation_fixed = 'X' + equation_fixed
+            # BUG FIX #4: Null/empty equations and simple X passthrough
+            if func is None:
+                return float(raw_value), ""
             
-            # Replace named variables like X1000, X100, X10 with the raw value
-            equation_fixed = re.sub(r'\bX\d+\b', str(raw_value), equation_fixed, flags=re.IGNORECASE)
+            # BUG FIX #1: Pre-check for potential division by zero
+            if raw_value == 0 and divides_by_x:
+                self.logger.warning(f"Potential division by zero in equation: {equation} (X=0)")
+                # Continue anyway, let exception handler catch actual errors
             
-            # BUG FIX #3 & #7: Create comprehensive evaluation namespace
-            namespace = {
-                # Primary data value
-                'X': raw_value,
-                'x': raw_value,
-                
-                # Multi-variable support (for tables with axis context)
-                'A': axis_context.get('row_index', 0),
-                'a': axis_context.get('row_index', 0),
-                'B': axis_context.get('col_index', 0),
-                'b': axis_context.get('col_index', 0),
-                'E': axis_context.get('row_index', 0),  # Alternative to A
-                'e': axis_context.get('row_index', 0),
-                'Y': axis_context.get('y_axis_value', 0),
-                'y': axis_context.get('y_axis_value', 0),
-                'Z': axis_context.get('x_axis_value', 0),
-                'z': axis_context.get('x_axis_value', 0),
-                
-                # Math functions (for exponential equations)
-                'exp': math.exp,
-                'log': math.log,
-                'log10': math.log10,
-                'sqrt': math.sqrt,
-                'pow': math.pow,
-                'abs': abs,
-                'sin': math.sin,
-                'cos': math.cos,
-                'tan': math.tan,
-                
-                # Mathematical constants
-                'E': math.e,
-                'PI': math.pi,
-                'pi': math.pi,
-                
-                '__builtins__': {}
-            }
-            
-            # Evaluate the expression
-            result = eval(equation_fixed, namespace)
+            # BUG FIX #7: Multi-variable support (A, B, Y, E, Z for tables)
+            if axis_context:
+                result = func(
+                    raw_value,
+                    axis_context.get('row_index', 0),
+                    axis_context.get('col_index', 0),
+                    axis_context.get('y_axis_value', 0),
+                    axis_context.get('x_axis_value', 0)
+                )
+            else:
+                result = func(raw_value)
             
             # BUG FIX #1: Check for invalid results (inf/nan from division by zero)
             if math.isinf(result):
@@ -1223,7 +1896,10 @@ class UniversalXDFExporter:
             bool: True if successful
         """
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8') as out:
+                # Lines are buffered and written to disk once per section
+                f = _Writer(out)
+                
                 # Write TunerPro-style header
                 f.write("=" * 60 + "\n")
                 f.write("TunerPro Bin Data Export\n")
@@ -1253,26 +1929,24 @@ class UniversalXDFExporter:
                         if raw_value is None:
                             continue
                         
-                        # Apply math equation
-                        value = raw_value
+                        # Apply math equation (evaluate_math returns a float or None)
+                        calc_value = None
                         if const['equation']:
                             calc_value, error = self.evaluate_math(
                                 const['equation'],
                                 raw_value
                             )
-                            if calc_value is not None:
-                                value = calc_value
-                            elif error:
+                            if calc_value is None and error:
                                 self.logger.warning(
                                     f"{const['title']}: {error}"
                                 )
                         
                         # Format value with unit using stored decimal places
                         decimalpl = const.get('decimalpl', 2)
-                        if isinstance(value, float):
-                            value_str = f"{value:.{decimalpl}f}"
+                        if calc_value is not None:
+                            value_str = f"{calc_value:.{decimalpl}f}"
                         else:
-                            value_str = str(value)
+                            value_str = str(raw_value)
                         
                         # Add unit if present
                         if const['unit']:
@@ -1281,6 +1955,7 @@ class UniversalXDFExporter:
                         # Write in TunerPro format: single line, right-aligned
                         title = const['title'][:48]  # Truncate long titles
                         f.write(f"SCALAR: {title:<48} {value_str:>22}\n")
+                    f.flush()
                 
                 # Export FLAGS
                 if self.elements['flags']:
@@ -1288,21 +1963,18 @@ class UniversalXDFExporter:
                     f.write("FLAG VALUES\n")
                     f.write("=" * 60 + "\n\n")
                     
-                    for flag in self.elements['flags']:
-                        byte_value = self.read_value_from_bin(
-                            flag['address'],
-                            8
-                        )
-                        
+                    for flag, byte_value in zip(self.elements['flags'],
+                                                self._read_flag_bytes()):
                         if byte_value is None:
                             continue
                         
                         # Check if flag is set
                         is_set = (byte_value & flag['mask']) != 0
-                        status = "Set" if is_set else "Not Set"
+                        status = FLAG_STATUS_TEXT[is_set]
                         
                         # Write in TunerPro format: simple Set/Not Set
                         f.write(f"FLAG: {flag['title']:<50} {status:>20}\n")
+                    f.flush()
                 
                 # Export TABLES with FULL DATA
                 if self.elements['tables']:
@@ -1358,40 +2030,31 @@ class UniversalXDFExporter:
                         z_decimalpl = z_axis.get('decimalpl', 2)
                         
                         # Extract and validate table data
-                        table_data = self._read_table_data(table)
+                        table_data, validation = self._read_and_validate_table(table)
                         
                         if table_data is not None:
-                            validation = self._validate_table_data(
-                                table, table_data
-                            )
-                            
                             # Show statistics
                             if 'stats' in validation:
                                 stats = validation['stats']
+                                unit_suffix = f" {z_axis['unit']}" if z_axis.get('unit') else ""
                                 f.write("  Statistics:\n")
                                 f.write(
                                     f"    Min: "
                                     f"{self._format_value(stats['min'], z_decimalpl)}"
                                 )
-                                if z_axis.get('unit'):
-                                    f.write(f" {z_axis['unit']}")
-                                f.write("\n")
+                                f.write(f"{unit_suffix}\n")
                                 
                                 f.write(
                                     f"    Max: "
                                     f"{self._format_value(stats['max'], z_decimalpl)}"
                                 )
-                                if z_axis.get('unit'):
-                                    f.write(f" {z_axis['unit']}")
-                                f.write("\n")
+                                f.write(f"{unit_suffix}\n")
                                 
                                 f.write(
                                     f"    Avg: "
                                     f"{self._format_value(stats['avg'], z_decimalpl)}"
                                 )
-                                if z_axis.get('unit'):
-                                    f.write(f" {z_axis['unit']}")
-                                f.write("\n")
+                                f.write(f"{unit_suffix}\n")
                                 
                                 f.write(
                                     f"    Unique Values: "
@@ -1414,29 +2077,29 @@ class UniversalXDFExporter:
                                     f"({len(table_data)} rows × {cols} cols):\n"
                                 )
                                 
-                                # Get decimal places for formatting
-                                z_decimalpl = z_axis.get('decimalpl', 2)
-                                y_decimalpl = axes.get('y', {}).get(
-                                    'decimalpl', 2
-                                )
+                                # Look up formatting and Y labels once per table
+                                format_value = self._format_value
+                                y_axis = axes.get('y', {})
+                                y_decimalpl = y_axis.get('decimalpl', 2)
+                                y_labels = y_axis.get('labels') or ()
+                                y_label_count = len(y_labels)
+                                
+                                # One format template per table instead of a
+                                # _format_value call per cell
+                                if z_decimalpl > 0:
+                                    format_cell = f"{{:.{z_decimalpl}f}}".format
+                                else:
+                                    format_cell = lambda v: format_value(v, z_decimalpl)
                                 
                                 # Output ALL rows (full export)
                                 for i, row in enumerate(table_data):
                                     # Get Y-axis label for row if available
                                     y_label = ""
-                                    if 'y' in axes:
-                                        y_ax = axes['y']
-                                        if y_ax.get('labels'):
-                                            y_labels = y_ax['labels']
-                                            if i < len(y_labels):
-                                                y_val = y_labels[i]
-                                                y_label = f" ({self._format_value(y_val, y_decimalpl)})"
+                                    if i < y_label_count:
+                                        y_label = f" ({format_value(y_labels[i], y_decimalpl)})"
                                     
                                     # Show ALL columns (no truncation)
-                                    values_str = ", ".join(
-                                        self._format_value(v, z_decimalpl)
-                                        for v in row
-                                    )
+                                    values_str = ", ".join(map(format_cell, row))
                                     
                                     f.write(
                                         f"    Row {i}{y_label}: "
@@ -1449,6 +2112,7 @@ class UniversalXDFExporter:
                             )
                         
                         f.write("\n")
+                        f.flush()
                     
                     # Summary warnings for zero tables
                     if zero_tables:
@@ -1534,6 +2198,7 @@ class UniversalXDFExporter:
                             f.write("    → WARNING: Patch may be corrupted or incompletely applied\n")
                         f.write("\n")
                 
+                f.flush()
                 self.logger.info(f"Export complete: {output_path}")
                 return True
                 
@@ -1577,22 +2242,16 @@ class UniversalXDFExporter:
             }
             
             # Export scalars
-            for const in self.elements['constants']:
-                raw_value = self.read_value_from_bin(
-                    const['address'], const['size'],
-                    signed=const.get('signed', False),
-                    lsb_first=const.get('lsb_first', False)
-                )
+            for const, raw_value in zip(self.elements['constants'], self._read_constant_values()):
                 if raw_value is None:
                     continue
                 
-                value = raw_value
+                # evaluate_math returns a float or None, so only it needs rounding
+                calc_value = None
                 if const['equation']:
                     calc_value, _ = self.evaluate_math(
                         const['equation'], raw_value
                     )
-                    if calc_value is not None:
-                        value = calc_value
                 
                 decimalpl = const.get('decimalpl', 2)
                 export_data['scalars'].append({
@@ -1600,7 +2259,7 @@ class UniversalXDFExporter:
                     'category': const['category'],
                     'address': f"0x{const['address']:04X}",
                     'raw_value': raw_value,
-                    'value': round(value, decimalpl) if isinstance(value, float) else value,
+                    'value': round(calc_value, decimalpl) if calc_value is not None else raw_value,
                     'unit': const['unit'],
                     'equation': const['equation'],
                     'signed': const.get('signed', False),
@@ -1609,8 +2268,7 @@ class UniversalXDFExporter:
                 })
             
             # Export flags
-            for flag in self.elements['flags']:
-                byte_value = self.read_value_from_bin(flag['address'], 8)
+            for flag, byte_value in zip(self.elements['flags'], self._read_flag_bytes()):
                 if byte_value is None:
                     continue
                 
@@ -1652,12 +2310,13 @@ class UniversalXDFExporter:
                 z_lsb_first = z_axis.get('lsb_first', False)
                 
                 # Extract full table data
-                table_data = self._read_table_data(table)
+                table_data = self._get_table_data(table)
                 if table_data is not None:
                     # Round values for JSON using proper precision
-                    table_entry['data'] = [
+                    rounded_data = [
                         [round(v, z_decimalpl) for v in row] for row in table_data
                     ]
+                    table_entry['data'] = rounded_data
                     table_entry['dimensions'] = {
                         'rows': len(table_data),
                         'cols': len(table_data[0]) if table_data else 0
@@ -1668,14 +2327,15 @@ class UniversalXDFExporter:
                         'decimalpl': z_decimalpl
                     }
                     
-                    # Add statistics
-                    flat = [v for row in table_data for v in row]
+                    # Add statistics (unique values counted on the rounded
+                    # data above rather than rounding every cell again)
+                    flat = list(chain.from_iterable(table_data))
                     if flat:
                         table_entry['statistics'] = {
                             'min': round(min(flat), z_decimalpl),
                             'max': round(max(flat), z_decimalpl),
-                            'avg': round(statistics.mean(flat), z_decimalpl),
-                            'unique_count': len(set(round(v, z_decimalpl) for v in flat))
+                            'avg': round(_mean(flat), z_decimalpl),
+                            'unique_count': len(set(chain.from_iterable(rounded_data)))
                         }
                 
                 export_data['tables'].append(table_entry)
@@ -1691,9 +2351,21 @@ class UniversalXDFExporter:
                 }
                 export_data['patches'].append(patch_entry)
             
-            # Write JSON
+            # Write JSON: json.dump writes every token separately, and one
+            # json.dumps string holds the whole document in memory, so
+            # gather the encoder's output into JSON_WRITE_CHUNK-sized writes
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+                parts = []
+                pending = 0
+                for chunk in encoder.iterencode(export_data):
+                    parts.append(chunk)
+                    pending += len(chunk)
+                    if pending >= JSON_WRITE_CHUNK:
+                        f.write(''.join(parts))
+                        parts.clear()
+                        pending = 0
+                f.write(''.join(parts))
             
             self.logger.info(f"JSON export complete: {output_path}")
             return True
@@ -1713,7 +2385,10 @@ class UniversalXDFExporter:
             bool: True if successful
         """
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8') as out:
+                # Lines are buffered and written to disk once per table
+                f = _Writer(out)
+                
                 # Header
                 f.write(f"# ECU Calibration Export\n\n")
                 f.write(f"## Metadata\n\n")
@@ -1752,18 +2427,16 @@ class UniversalXDFExporter:
                     if raw_value is None:
                         continue
                     
-                    value = raw_value
+                    calc_value = None
                     if const['equation']:
                         calc_value, _ = self.evaluate_math(
                             const['equation'], raw_value
                         )
-                        if calc_value is not None:
-                            value = calc_value
                     
-                    val_str = f"{value:.2f}" if isinstance(value, float) else str(value)
+                    val_str = f"{calc_value:.2f}" if calc_value is not None else str(raw_value)
                     unit = const['unit'] or '-'
                     cat = const['category'] or 'Uncategorized'
-                    title = const['title'].replace('|', '\\|')
+                    title = const['title_md']
                     
                     f.write(f"| {title} | {val_str} | {unit} | {cat} |\n")
                 
@@ -1772,21 +2445,22 @@ class UniversalXDFExporter:
                 f.write(f"| Flag | Status | Category |\n")
                 f.write(f"|------|--------|----------|\n")
                 
-                for flag in self.elements['flags']:
-                    byte_value = self.read_value_from_bin(flag['address'], 8)
+                for flag, byte_value in zip(self.elements['flags'], self._read_flag_bytes()):
                     if byte_value is None:
                         continue
                     
                     is_set = (byte_value & flag['mask']) != 0
-                    status = "✅ Set" if is_set else "❌ Not Set"
+                    status = FLAG_STATUS_MD[is_set]
                     cat = flag['category'] or 'Uncategorized'
-                    title = flag['title'].replace('|', '\\|')
+                    title = flag['title_md']
                     
                     f.write(f"| {title} | {status} | {cat} |\n")
                 
                 # Tables
                 f.write(f"\n---\n\n## Tables\n\n")
                 
+                axis_names = {'x': 'X-Axis', 'y': 'Y-Axis', 'z': 'Z-Axis (Data)'}
+                
                 for i, table in enumerate(self.elements['tables'], 1):
                     title = table['title']
                     f.write(f"### {i}. {title}\n\n")
@@ -1796,74 +2470,82 @@ class UniversalXDFExporter:
                     
                     # Axes info
                     axes = table['axes']
+                    x_axis = axes.get('x', {})
+                    y_axis = axes.get('y', {})
+                    z_axis = axes.get('z', {})
                     if axes:
                         f.write(f"**Axes:**\n")
                         for axis_id, axis in axes.items():
-                            axis_name = {'x': 'X-Axis', 'y': 'Y-Axis', 'z': 'Z-Axis (Data)'}.get(axis_id, axis_id)
+                            axis_name = axis_names.get(axis_id, axis_id)
                             unit = f" ({axis['unit']})" if axis['unit'] else ""
                             f.write(f"- {axis_name}: {axis['count']} points{unit}\n")
                         f.write("\n")
                     
-                    # Extract table data
-                    table_data = self._read_table_data(table)
+                    # Extract table data (statistics shared with the text export)
+                    table_data, validation = self._read_and_validate_table(table)
                     if table_data is not None:
                         # Statistics
-                        flat = [v for row in table_data for v in row]
-                        if flat:
-                            z_unit = axes.get('z', {}).get('unit', '')
+                        stats = validation.get('stats')
+                        if stats:
+                            z_unit = z_axis.get('unit', '')
                             f.write(f"**Statistics:**\n")
-                            f.write(f"- Min: {min(flat):.4f} {z_unit}\n")
-                            f.write(f"- Max: {max(flat):.4f} {z_unit}\n")
-                            f.write(f"- Avg: {statistics.mean(flat):.4f} {z_unit}\n")
+                            f.write(f"- Min: {stats['min']:.4f} {z_unit}\n")
+                            f.write(f"- Max: {stats['max']:.4f} {z_unit}\n")
+                            f.write(f"- Avg: {stats['avg']:.4f} {z_unit}\n")
                             f.write(f"- Dimensions: {len(table_data)} × {len(table_data[0])}\n\n")
                         
                         # Full Data Table (all rows and columns)
                         if len(table_data) > 0 and len(table_data[0]) > 0:
                             cols = len(table_data[0])
-                            z_decimalpl = axes.get('z', {}).get('decimalpl', 2)
-                            y_decimalpl = axes.get('y', {}).get('decimalpl', 2)
+                            z_decimalpl = z_axis.get('decimalpl', 2)
+                            y_decimalpl = y_axis.get('decimalpl', 2)
                             
                             f.write(f"**Full Data Table** ({len(table_data)} rows × {cols} cols):\n\n")
                             
                             # Get X-axis labels for header if available
-                            x_labels = axes.get('x', {}).get('labels', [])
-                            x_decimalpl = axes.get('x', {}).get('decimalpl', 2)
+                            x_labels = x_axis.get('labels', [])
+                            x_decimalpl = x_axis.get('decimalpl', 2)
                             
                             # Get Y-axis labels for row labels
-                            y_labels = axes.get('y', {}).get('labels', [])
+                            y_labels = y_axis.get('labels', [])
                             
                             # Header row with X-axis values
+                            format_value = self._format_value
                             if x_labels:
-                                f.write("| Y \\ X |")
-                                for c, label in enumerate(x_labels[:cols]):
-                                    f.write(f" {self._format_value(label, x_decimalpl)} |")
-                                f.write("\n")
+                                header = " | ".join(
+                                    format_value(label, x_decimalpl) for label in islice(x_labels, cols)
+                                )
+                                f.write(f"| Y \\ X | {header} |\n")
                             else:
-                                f.write("| Row |")
-                                for c in range(cols):
-                                    f.write(f" C{c} |")
-                                f.write("\n")
+                                header = " | ".join(f"C{c}" for c in range(cols))
+                                f.write(f"| Row | {header} |\n")
                             
                             # Separator row
-                            f.write("|-----|")
-                            for c in range(cols):
-                                f.write("------|")
-                            f.write("\n")
+                            f.write("|-----|" + "------|" * cols + "\n")
+                            
+                            # One template for a whole row, specialized to this
+                            # table's column count and decimal places
+                            if z_decimalpl > 0:
+                                cell = f"{{:.{z_decimalpl}f}}"
+                                format_row = ("| {} | " + " | ".join([cell] * cols) + " |\n").format
+                            else:
+                                def format_row(label, *values):
+                                    cells = " | ".join(format_value(v, z_decimalpl) for v in values)
+                                    return f"| {label} | {cells} |\n"
+                            y_label_count = len(y_labels) if y_labels else 0
                             
-                            # All data rows
+                            # All data rows, each rendered and written at once
                             for r, row_data in enumerate(table_data):
                                 # Row label from Y-axis if available
-                                if y_labels and r < len(y_labels):
-                                    row_label = self._format_value(y_labels[r], y_decimalpl)
+                                if r < y_label_count:
+                                    row_label = format_value(y_labels[r], y_decimalpl)
                                 else:
                                     row_label = str(r)
                                 
-                                f.write(f"| {row_label} |")
-                                for val in row_data:
-                                    f.write(f" {self._format_value(val, z_decimalpl)} |")
-                                f.write("\n")
+                                f.write(format_row(row_label, *row_data))
                     
                     f.write("\n")
+                    f.flush()
                 
                 # Export patches
                 if self.elements['patches']:
@@ -1906,6 +2588,7 @@ class UniversalXDFExporter:
                 f.write("---\n\n")
                 f.write(f"*Generated by KingAI TunerPro Exporter v{self.VERSION}*\n")
                 f.write(f"*Author: {self.AUTHOR_ALIAS} ({self.AUTHOR})*\n")
+                f.flush()
             
             self.logger.info(f"Markdown export complete: {output_path}")
             return True
@@ -1914,6 +2597,28 @@ class UniversalXDFExporter:
             self.logger.error(f"Markdown export failed: {e}")
             return False
 
+    def close(self):
+        """
+        Release the BIN buffer and its memory map
+        
+        Call once every export has been written. Afterwards the BIN reads
+        as empty (reads log the usual out-of-range warnings) until
+        load_bin_file() or validate_bin_file() maps it again. Safe to call
+        more than once.
+        """
+        bin_data, self.bin_data = self.bin_data, None
+        bin_mmap, self._bin_mmap = self._bin_mmap, None
+        self.bin_size = 0
+        self._table_data_cache.clear()
+        try:
+            if isinstance(bin_data, memoryview):
+                bin_data.release()
+            if bin_mmap is not None:
+                bin_mmap.close()
+        except BufferError:
+            # A slice is still referenced somewhere; let GC unmap it
+            pass
+    
     def export(self, output_path: str) -> bool:
         """
         Main export function - validates, parses, and exports
@@ -1932,7 +2637,7 @@ class UniversalXDFExporter:
         if not self.parse_xdf():
             return False
         
-        # Export to text
+        # Export to text (the BIN stays mapped; call close() when done)
         return self.export_to_text(output_path)
 
 
@@ -1984,8 +2689,7 @@ def main():
     export_format = sys.argv[4].lower() if len(sys.argv) > 4 else 'txt'
     
     # Normalize format
-    if export_format == 'text':
-        export_format = 'txt'
+    export_format = {'text': 'txt', 'markdown': 'md'}.get(export_format, export_format)
     
     # Create exporter
     exporter = UniversalXDFExporter(xdf_file, bin_file)
@@ -2002,31 +2706,32 @@ def main():
     success = True
     outputs = []
     
+    # Format -> (summary label, file suffix used by 'all', export method)
+    handlers = {
+        'txt': ('TXT', '.txt', exporter.export_to_text),
+        'json': ('JSON', '.json', exporter.export_to_json),
+        'md': ('Markdown', '.md', exporter.export_to_markdown),
+    }
+    if export_format == 'all':
+        targets = list(handlers)
+    else:
+        targets = [export_format] if export_format in handlers else []
+    
     # Determine output paths and export
     base_path = Path(output_base)
     base_name = base_path.stem
     base_dir = base_path.parent
     
-    if export_format in ('txt', 'all'):
-        txt_path = base_dir / f"{base_name}.txt" if export_format == 'all' else output_base
-        if exporter.export_to_text(str(txt_path)):
-            outputs.append(('TXT', str(txt_path)))
+    for fmt in targets:
+        label, suffix, export = handlers[fmt]
+        path = str(base_dir / f"{base_name}{suffix}") if export_format == 'all' else output_base
+        if export(path):
+            outputs.append((label, path))
         else:
             success = False
     
-    if export_format in ('json', 'all'):
-        json_path = base_dir / f"{base_name}.json" if export_format == 'all' else output_base
-        if exporter.export_to_json(str(json_path)):
-            outputs.append(('JSON', str(json_path)))
-        else:
-            success = False
-    
-    if export_format in ('md', 'markdown', 'all'):
-        md_path = base_dir / f"{base_name}.md" if export_format == 'all' else output_base
-        if exporter.export_to_markdown(str(md_path)):
-            outputs.append(('Markdown', str(md_path)))
-        else:
-            success = False
+    # All outputs written; release the BIN mapping
+    exporter.close()
     
     # Summary
     print()